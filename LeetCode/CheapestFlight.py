@@ -1,3 +1,6 @@
+import numpy as np
+
+
 class Solution(object):
     def findCheapestPrice(self, n, flights, src, dst, k):
         """
@@ -8,17 +11,28 @@ class Solution(object):
         :type k: int
         :rtype: int
         """
-        prev = [float('inf')] * n
+        # columns of the flight list as flat arrays, built once
+        U = np.fromiter((f[0] for f in flights), np.int32, count=len(flights))
+        V = np.fromiter((f[1] for f in flights), np.int32, count=len(flights))
+        W = np.fromiter((f[2] for f in flights), np.int64, count=len(flights))
+
+        # finite integer sentinel instead of float('inf'): the whole pass
+        # stays in integer arithmetic; int64 accumulators keep INF + w
+        # from wrapping around
+        INF = np.iinfo(np.int32).max
+        prev = np.full(n, INF, np.int64)
         prev[src] = 0
 
         for i in range(k + 1):
-            curr = prev[:]
-            for u, v, w in flights:
-                if prev[u] + w < curr[v]:
-                    curr[v] = prev[u] + w
+            curr = prev.copy()
+            cand = prev[U] + W
+            # unbuffered minimum handles duplicate destination vertices correctly
+            np.minimum.at(curr, V, cand)
             prev = curr  # move to next
 
-        return -1 if prev[dst] == float('inf') else prev[dst]
+        return -1 if prev[dst] == INF else int(prev[dst])
 
 # Time: O((k+1) * N) where N = num of flights
-# Idea: modified Bellman–Ford algorithm which relaxes edges up to k+1 times, otherwise we are done with that
\ No newline at end of file
+# Idea: modified Bellman–Ford algorithm which relaxes edges up to k+1 times,
+# but each round is one vectorized gather + np.minimum.at scatter instead of
+# a per-edge Python loop
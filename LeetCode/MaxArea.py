@@ -1,33 +1,66 @@
 from typing import List
 
+import numpy as np
 
-class Solution:
-    def maxAreaOfIsland(self, grid: List[List[int]]) -> int:
-        rows, cols = len(grid), len(grid[0])
-        max_area = 0
+try:
+    from numba import njit
+    _HAVE_NUMBA = True
+except ImportError:  # pure-Python flood fill still works, just slower
+    _HAVE_NUMBA = False
 
-        def dfs(r, c):
-            # Base case, borders
-            if r < 0 or r >= rows or c < 0 or c >= cols or grid[r][c] == 0:
-                return 0
 
-            grid[r][c] = 0  # visited
-            area = 1  # current
+def _max_area(grid):
+    # explicit stack of packed r*cols+c indices instead of recursion:
+    # no Python frames, no RecursionError on large grids
+    rows, cols = grid.shape
+    stack = np.empty(rows * cols, np.int32)
+    max_area = 0
+    for r0 in range(rows):
+        for c0 in range(cols):
+            if grid[r0, c0] == 1:
+                top = 0
+                stack[0] = r0 * cols + c0
+                grid[r0, c0] = 0  # visited
+                area = 0
+                while top >= 0:
+                    cur = stack[top]
+                    top -= 1
+                    area += 1
+                    r = cur // cols
+                    c = cur % cols
+                    if r + 1 < rows and grid[r + 1, c] == 1:
+                        grid[r + 1, c] = 0
+                        top += 1
+                        stack[top] = cur + cols
+                    if r - 1 >= 0 and grid[r - 1, c] == 1:
+                        grid[r - 1, c] = 0
+                        top += 1
+                        stack[top] = cur - cols
+                    if c + 1 < cols and grid[r, c + 1] == 1:
+                        grid[r, c + 1] = 0
+                        top += 1
+                        stack[top] = cur + 1
+                    if c - 1 >= 0 and grid[r, c - 1] == 1:
+                        grid[r, c - 1] = 0
+                        top += 1
+                        stack[top] = cur - 1
+                if area > max_area:
+                    max_area = area
+    return max_area
 
-            area += dfs(r + 1, c)
-            area += dfs(r - 1, c)
-            area += dfs(r, c + 1)
-            area += dfs(r, c - 1)
 
-            return area
+if _HAVE_NUMBA:
+    _max_area = njit("i8(i1[:,::1])", cache=True)(_max_area)
 
-        for r in range(rows):
-            for c in range(cols):
-                if grid[r][c] == 1:
-                    max_area = max(max_area, dfs(r, c))
 
-        return max_area
+class Solution:
+    def maxAreaOfIsland(self, grid: List[List[int]]) -> int:
+        # one int8 copy of the grid; the kernel marks visited cells in it,
+        # so the caller's grid stays untouched
+        g = np.ascontiguousarray(np.asarray(grid, dtype=np.int8))
+        return int(_max_area(g))
 
 # Time: O(m * n)
-# We start a DFS (OR BFS, doesn't matter, I just like DFS more) to count all connected cells.
-# Mark visited cells as 0 and keep track of the maximum area found.
\ No newline at end of file
+# We flood-fill each island with an explicit stack (DFS without recursion),
+# mark visited cells as 0 and keep track of the maximum area found.
+# The kernel is numba-compiled over a packed int8 grid when available.
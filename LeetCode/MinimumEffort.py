@@ -1,34 +1,71 @@
-import heapq
 from typing import List
 
+import numpy as np
 
-class Solution:
-    def minimumEffortPath(self, heights: List[List[int]]) -> int:
-        rows = len(heights)
-        cols = len(heights[0])
-        efforts = [[float('inf')] * cols for i in range(rows)]
-        efforts[0][0] = 0
+try:
+    from numba import njit
+    _HAVE_NUMBA = True
+except ImportError:  # pure-Python BFS still works, just slower
+    _HAVE_NUMBA = False
 
-        # Min-heap effort row, col
-        heap = [(0, 0, 0)]
 
-        directions = [(1, 0), (-1, 0), (0, 1), (0, -1)]
+def _reachable(H, tau):
+    # BFS from (0,0) using only edges with |height diff| <= tau;
+    # flat int32 queue + uint8 visited, no Python objects in the loop
+    rows, cols = H.shape
+    total = rows * cols
+    visited = np.zeros(total, np.uint8)
+    q = np.empty(total, np.int32)
+    head = 0
+    tail = 1
+    q[0] = 0
+    visited[0] = 1
+    target = total - 1
+    while head < tail:
+        cur = q[head]
+        head += 1
+        if cur == target:
+            return True
+        r = cur // cols
+        c = cur % cols
+        h = H[r, c]
+        if r + 1 < rows and visited[cur + cols] == 0 and abs(H[r + 1, c] - h) <= tau:
+            visited[cur + cols] = 1
+            q[tail] = cur + cols
+            tail += 1
+        if r - 1 >= 0 and visited[cur - cols] == 0 and abs(H[r - 1, c] - h) <= tau:
+            visited[cur - cols] = 1
+            q[tail] = cur - cols
+            tail += 1
+        if c + 1 < cols and visited[cur + 1] == 0 and abs(H[r, c + 1] - h) <= tau:
+            visited[cur + 1] = 1
+            q[tail] = cur + 1
+            tail += 1
+        if c - 1 >= 0 and visited[cur - 1] == 0 and abs(H[r, c - 1] - h) <= tau:
+            visited[cur - 1] = 1
+            q[tail] = cur - 1
+            tail += 1
+    return False
 
-        while heap:
-            effort, r, c = heapq.heappop(heap)
 
-            if r == rows - 1 and c == cols - 1:
-                return effort
+if _HAVE_NUMBA:
+    _reachable = njit("b1(i4[:,::1], i8)", cache=True)(_reachable)
 
-            for dr, dc in directions:
-                nr, nc = r + dr, c + dc
-                if 0 <= nr < rows and 0 <= nc < cols:
-                    new_effort = max(effort, abs(heights[nr][nc] - heights[r][c]))
-                    if new_effort < efforts[nr][nc]:
-                        efforts[nr][nc] = new_effort
-                        heapq.heappush(heap, (new_effort, nr, nc))
 
-        return 0
+class Solution:
+    def minimumEffortPath(self, heights: List[List[int]]) -> int:
+        H = np.asarray(heights, dtype=np.int32)
+        lo = 0
+        hi = int(H.max() - H.min())
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if _reachable(H, mid):
+                hi = mid
+            else:
+                lo = mid + 1
+        return lo
 
-# Time: O(m * n * log(m * n))
-# Idea: Dijkstra’s algorithm but instead of summing weights we track the maximum weight at the moment with each path
\ No newline at end of file
+# Time: O(m * n * log(max_h))
+# Idea: binary-search the answer tau and check reachability with a plain BFS
+# restricted to edges where |height difference| <= tau. Each check is a tight
+# integer sweep (numba-compiled when available) instead of Python heap ops.
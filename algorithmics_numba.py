@@ -0,0 +1,114 @@
+"""Numba-compiled CSR kernels for GraphAlgorithms.
+
+Each kernel works purely on the flat CSR arrays from Graph.get_csr() —
+no Python objects are touched inside the hot loops, so numba lowers them
+to native code with int32 compares and a preallocated uint8 visited array.
+Signatures are given explicitly to avoid lazy compilation, and cache=True
+stores the compiled code on disk so only the first-ever run pays for it.
+
+algorithmics.py imports these kernels with a try/except and falls back to
+the pure-Python versions when numba is not installed.
+"""
+
+import numpy as np
+from numba import njit
+
+
+@njit("i4[::1](i4[::1], i4[::1], i4, i4)", cache=True)
+def _bfs_csr(indptr, indices, start, n):
+    """BFS over CSR; returns vertices in dequeue order."""
+    order = np.empty(n, np.int32)
+    visited = np.zeros(n, np.uint8)
+    q = np.empty(n, np.int32)
+    head = 0
+    tail = 0
+    q[tail] = start
+    tail += 1
+    visited[start] = 1
+    cnt = 0
+    while head < tail:
+        u = q[head]
+        head += 1
+        order[cnt] = u
+        cnt += 1
+        for j in range(indptr[u], indptr[u + 1]):
+            v = indices[j]
+            if visited[v] == 0:
+                visited[v] = 1
+                q[tail] = v
+                tail += 1
+    return order[:cnt]
+
+
+@njit("i4[::1](i4[::1], i4[::1], i4, i4)", cache=True)
+def _dfs_csr(indptr, indices, start, n):
+    """Iterative DFS over CSR reproducing recursive preorder.
+
+    next_edge[u] remembers how far into u's neighbor slice we got, so
+    popping back to u resumes exactly where the recursive version would.
+    """
+    order = np.empty(n, np.int32)
+    visited = np.zeros(n, np.uint8)
+    stack = np.empty(n, np.int32)
+    next_edge = np.empty(n, np.int32)
+
+    top = 0
+    stack[0] = start
+    next_edge[start] = indptr[start]
+    visited[start] = 1
+    order[0] = start
+    cnt = 1
+    while top >= 0:
+        u = stack[top]
+        j = next_edge[u]
+        if j < indptr[u + 1]:
+            next_edge[u] = j + 1
+            v = indices[j]
+            if visited[v] == 0:
+                visited[v] = 1
+                order[cnt] = v
+                cnt += 1
+                top += 1
+                stack[top] = v
+                next_edge[v] = indptr[v]
+        else:
+            top -= 1
+    return order[:cnt]
+
+
+@njit("i4[::1](i4, i4[::1], i4[::1])", cache=True)
+def _cc_union_find(n, src, dst):
+    """Union-find over flat edge arrays; returns root label per vertex.
+
+    Weighted union by rank with path halving. Edges are treated as
+    undirected, so directed graphs get weak components for free — no
+    symmetrized adjacency needs to be built.
+    """
+    parent = np.arange(n, dtype=np.int32)
+    rank = np.zeros(n, dtype=np.int8)
+    for i in range(src.shape[0]):
+        a = src[i]
+        while parent[a] != a:
+            parent[a] = parent[parent[a]]
+            a = parent[a]
+        b = dst[i]
+        while parent[b] != b:
+            parent[b] = parent[parent[b]]
+            b = parent[b]
+        if a != b:
+            if rank[a] < rank[b]:
+                a, b = b, a
+            parent[b] = a
+            if rank[a] == rank[b]:
+                rank[a] += 1
+    # flatten every vertex directly onto its root
+    for v in range(n):
+        r = v
+        while parent[r] != r:
+            r = parent[r]
+        a = v
+        while parent[a] != r:
+            nxt = parent[a]
+            parent[a] = r
+            a = nxt
+    return parent
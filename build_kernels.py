@@ -0,0 +1,27 @@
+"""AOT-compile the CSR kernels into a `graph_kernels` shared library.
+
+Numba's biggest user-visible cost is first-call JIT compilation (hundreds
+of ms), which dominates when many small graphs are processed. Running
+
+    python build_kernels.py
+
+compiles the kernels from algorithmics_numba.py ahead of time into
+graph_kernels.<ext>.so next to this file; algorithmics.py prefers that
+module when present and falls back to the JIT versions (and then to pure
+Python) otherwise. The kernel bodies are single-sourced: we export the
+undecorated .py_func of each @njit kernel with the same explicit
+signature.
+"""
+
+from numba.pycc import CC
+
+from algorithmics_numba import _bfs_csr, _dfs_csr, _cc_union_find
+
+cc = CC("graph_kernels")
+
+cc.export("bfs_csr", "i4[::1](i4[::1], i4[::1], i4, i4)")(_bfs_csr.py_func)
+cc.export("dfs_csr", "i4[::1](i4[::1], i4[::1], i4, i4)")(_dfs_csr.py_func)
+cc.export("cc_union_find", "i4[::1](i4, i4[::1], i4[::1])")(_cc_union_find.py_func)
+
+if __name__ == "__main__":
+    cc.compile()
@@ -1,5 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import Dict, List, Tuple
+from operator import itemgetter
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
 
 
 class Graph(ABC):
@@ -24,6 +27,14 @@ class Graph(ABC):
         self.directed = directed
         self.weighted = weighted
         self._adjacency_list: Dict[int, List[Tuple[int, float]]] = {i: [] for i in range(vertices)}
+        # per-vertex map neighbor -> position in the adjacency list, so
+        # add_edge answers "is v already a neighbor of u?" in O(1) instead
+        # of scanning u's whole neighbor list on every insertion
+        self._neighbor_index: List[Dict[int, int]] = [{} for _ in range(vertices)]
+        # lazily built representations, invalidated by add_edge
+        self._csr_cache: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None
+        self._adj_cache: Optional[Dict[int, List[Tuple[int, float]]]] = None
+        self._bitset_cache: Optional[np.ndarray] = None
 
     def _check_vertex(self, v: int) -> None:
         """Helper method to verify vertex index validity.
@@ -31,7 +42,9 @@ class Graph(ABC):
         Args:
             v (int): Vertex index to validate.
         """
-        if not (0 <= v < self.vertices):
+        # two plain comparisons; CPython does not fuse the chained
+        # 0 <= v < n form into one check, and this runs twice per add_edge
+        if v < 0 or v >= self.vertices:
             raise IndexError(f"vertex {v} is out of range [0, {self.vertices - 1}]")
 
     @abstractmethod
@@ -50,44 +63,223 @@ class Graph(ABC):
         pass
 
 
+    def add_edges(self, us, vs, ws=None) -> None:
+        """Bulk edge insertion: one validation pass, one cache drop.
+
+        Validates all endpoints with vectorized numpy checks, invalidates
+        the cached representations once, then appends through the
+        subclass's _insert_edge — per-edge Python overhead shrinks to a
+        single local call instead of checks plus cache bookkeeping on
+        every add_edge.
+
+        Args:
+            us: array-like of source vertices.
+            vs: array-like of target vertices (same length as us).
+            ws: array-like of weights, optional; defaults to all 1.0
+                (ignored by unweighted graphs either way).
+        """
+        us = np.asarray(us, dtype=np.int64).ravel()
+        vs = np.asarray(vs, dtype=np.int64).ravel()
+        if us.shape != vs.shape:
+            raise ValueError("us and vs must have the same length")
+        if us.size == 0:
+            return
+
+        out = (us < 0) | (us >= self.vertices) | (vs < 0) | (vs >= self.vertices)
+        if np.any(out):
+            bad = int(np.argmax(out))
+            raise IndexError(
+                f"edge ({us[bad]}, {vs[bad]}) is out of vertex range [0, {self.vertices - 1}]"
+            )
+        if np.any(us == vs):
+            raise ValueError("self-loops are not allowed")
+
+        if ws is None:
+            ws_list = [1.0] * us.size
+        else:
+            ws_list = np.asarray(ws, dtype=np.float64).ravel().tolist()
+            if len(ws_list) != us.size:
+                raise ValueError("ws must have the same length as us and vs")
+
+        self._csr_cache = None
+        self._adj_cache = None
+        self._bitset_cache = None
+
+        insert = self._insert_edge  # bind once for the loop
+        for u, v, w in zip(us.tolist(), vs.tolist(), ws_list):
+            insert(u, v, w)
+
+    def _insert_edge(self, u: int, v: int, w: float) -> None:
+        """Append one pre-validated edge; implemented by subclasses."""
+        raise NotImplementedError
+
+
     #   GRAPH REPRESENTATIONS
 
+    def get_csr(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return the graph in CSR (compressed sparse row) form.
+
+        The neighbors of vertex u are `indices[indptr[u]:indptr[u+1]]`
+        (sorted ascending) and their weights occupy the same slice of
+        `weights`. Packing neighbors into flat numpy arrays keeps them
+        contiguous in memory, so traversals touch cache lines full of
+        neighbor ids instead of chasing one tuple pointer per edge.
+
+        The arrays are built lazily from the adjacency list on first call
+        and cached; add_edge invalidates the cache.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]:
+                (indptr[n+1] int32, indices[m] int32, weights[m] float32).
+                For unweighted graphs all weights are 1.0. float32 halves
+                the memory traffic of the weight array versus boxed floats,
+                which matters on memory-bound weighted sweeps.
+        """
+        if self._csr_cache is None:
+            n = self.vertices
+            indptr = np.zeros(n + 1, dtype=np.int32)
+            for v, neighbors in self._adjacency_list.items():
+                indptr[v + 1] = len(neighbors)
+            np.cumsum(indptr, out=indptr)
+            m = int(indptr[-1])
+            indices = np.empty(m, dtype=np.int32)
+            weights = np.empty(m, dtype=np.float32)
+            pos = 0
+            for v in range(n):
+                for u, w in self._adjacency_list[v]:
+                    indices[pos] = u
+                    weights[pos] = w
+                    pos += 1
+            # sort each row slice in C via argsort instead of a Python-level
+            # sorted() with a key callback per comparison
+            for v in range(n):
+                s, e = int(indptr[v]), int(indptr[v + 1])
+                if e - s > 1:
+                    order = np.argsort(indices[s:e], kind="stable")
+                    indices[s:e] = indices[s:e][order]
+                    weights[s:e] = weights[s:e][order]
+            self._csr_cache = (indptr, indices, weights)
+        return self._csr_cache
+
+    def reordered_rcm(self) -> Tuple["Graph", np.ndarray]:
+        """Return a copy of the graph relabeled by reverse Cuthill-McKee.
+
+        RCM gives neighboring vertices nearby labels, so traversals over the
+        relabeled graph walk memory almost sequentially instead of jumping
+        between cold cache lines. Downstream algorithms should run on the
+        returned graph; map their results back to the original labels with
+        the returned permutation (`perm[new] = old`).
+
+        Returns:
+            Tuple[Graph, np.ndarray]: the relabeled graph (same concrete
+            class, same direction/weight flags) and the RCM permutation.
+        """
+        from algorithmics import GraphAlgorithms  # local import, avoids a cycle
+
+        perm = GraphAlgorithms.reorder_rcm(self)
+        inv = np.empty(self.vertices, dtype=np.int64)  # old label -> new label
+        inv[perm] = np.arange(self.vertices)
+
+        g = type(self)(self.vertices, self.directed)
+        for u, neighbors in self._adjacency_list.items():
+            for v, w in neighbors:
+                g.add_edge(int(inv[u]), int(inv[v]), w)
+        return g, perm
+
+    def get_bitset_adjacency(self) -> np.ndarray:
+        """Return the adjacency as a packed bit-matrix of uint64 words.
+
+        Row u holds ceil(n/64) words whose set bits mark u's neighbors —
+        1 bit per potential edge instead of ~56 bytes per stored tuple.
+        For dense graphs (m greater than roughly n^2/64) this is both far
+        smaller than the adjacency list and enables bit-parallel sweeps:
+        a single 64-bit OR/AND processes 64 edge checks at once (see
+        GraphAlgorithms.bfs_bitset). Built lazily from the CSR arrays and
+        cached; add_edge invalidates the cache.
+
+        Returns:
+            np.ndarray: uint64 array of shape (n, ceil(n/64)).
+        """
+        if self._bitset_cache is None:
+            n = self.vertices
+            words = (n + 63) // 64
+            A = np.zeros((n, words), dtype=np.uint64)
+            indptr, indices, _ = self.get_csr()
+            rows = np.repeat(np.arange(n, dtype=np.int64), np.diff(indptr))
+            bits = np.uint64(1) << (indices % 64).astype(np.uint64)
+            np.bitwise_or.at(A, (rows, indices // 64), bits)
+            self._bitset_cache = A
+        return self._bitset_cache
+
     def get_adjacency_list(self) -> Dict[int, List[Tuple[int, float]]]:
         """Return the graph as an adjacency list: {v: [(u, weight), ...], ...}.
-        Return deep-copied and sorted adjacency list.
+        Return sorted adjacency list; built once and cached.
 
-        Returns:
-            Dict[int, List[Tuple[int, float]]]: a copy of the adjacency list where
-            each vertex maps to a list of (neighbor, weight) pairs.
+        The dict (fresh lists, fresh tuples, per-vertex sorts) used to be
+        rebuilt on every call — hundreds of MB of churn on large graphs when
+        several algorithms each ask for it. The graph is immutable while an
+        algorithm runs, so the result is cached and add_edge invalidates it.
+        Treat the returned structure as read-only.
 
-        Hints:
-            - Build a new dict with new lists of (u, weight) pairs.
-            - Sort neighbors by u (and by weight if needed).
+        Returns:
+            Dict[int, List[Tuple[int, float]]]: the adjacency list where
+            each vertex maps to a sorted list of (neighbor, weight) pairs.
         """
-        adj_copy: Dict[int, List[Tuple[int, float]]] = {}
-        for v, neighbors in self._adjacency_list.items():
-            sorted_neighbors = sorted(neighbors, key=lambda x: x[0])
-            adj_copy[v] = [(u, w) for u, w in sorted_neighbors]
-        return adj_copy
+        if self._adj_cache is None:
+            adj_copy: Dict[int, List[Tuple[int, float]]] = {}
+            for v, neighbors in self._adjacency_list.items():
+                # itemgetter avoids a Python-level lambda call per comparison
+                adj_copy[v] = sorted(neighbors, key=itemgetter(0))
+            self._adj_cache = adj_copy
+        return self._adj_cache
+
+
+    def get_adjacency_matrix_np(self) -> np.ndarray:
+        """Return the adjacency matrix as a dense float32 numpy array.
 
+        Built with a single vectorized scatter from the CSR arrays instead
+        of a double Python loop, and float32 halves the memory of the
+        boxed-float list-of-lists.
+
+        Returns:
+            np.ndarray: float32 matrix of shape (n, n).
+        """
+        n = self.vertices
+        indptr, indices, weights = self.get_csr()
+        rows = np.repeat(np.arange(n, dtype=np.int32), np.diff(indptr))
+        matrix = np.zeros((n, n), dtype=np.float32)
+        matrix[rows, indices] = weights if self.weighted else 1.0
+        return matrix
 
     def get_adjacency_matrix(self) -> List[List[float]]:
         """Return the adjacency matrix of size n x n (n = number of vertices).
         Return n×n adjacency matrix (weighted/unweighted)
 
+        Kept for the original list-of-lists contract; the entries are
+        scattered with vectorized numpy stores and converted at the end.
+        Prefer get_adjacency_matrix_np() when a numpy array is acceptable.
+
         Returns:
             List[List[float]]: square matrix representation.
         """
-
         n = self.vertices
-        matrix = [[0.0 for _ in range(n)] for _ in range(n)]
-        for u, neighbors in self._adjacency_list.items():
-            for v, w in neighbors:
-                matrix[u][v] = float(w) if self.weighted else 1.0
-        return matrix
+        matrix = np.zeros((n, n), dtype=np.float64)
+        if self.weighted:
+            # scatter from the adjacency list, not the CSR arrays: the
+            # float32 CSR weights are a kernel-facing representation and
+            # would silently round the exact float64 weights this legacy
+            # API promises (1.8 -> 1.7999999523162842)
+            for u, neighbors in self._adjacency_list.items():
+                if neighbors:
+                    matrix[u, [v for v, _ in neighbors]] = [w for _, w in neighbors]
+        else:
+            indptr, indices, _ = self.get_csr()
+            rows = np.repeat(np.arange(n, dtype=np.int32), np.diff(indptr))
+            matrix[rows, indices] = 1.0
+        return matrix.tolist()
 
 
-    def get_incidence_matrix(self) -> List[List[int]]:
+    def get_incidence_matrix(self, sparse: bool = False):
         """Return the incidence matrix of size n x m (n = vertices, m = edges).
         Return incidence matrix (n × m).
 
@@ -102,32 +294,44 @@ class Graph(ABC):
                 * Directed: lexicographically by (u, v)
                 * Undirected: by (min(u, v), max(u, v))
 
+        The edge columns come straight from the CSR arrays (already sorted
+        row by row, so the required column order falls out for free) and the
+        entries are written with two vectorized scatters. With sparse=True
+        the matrix is returned as scipy.sparse.csc_matrix with exactly 2m
+        nonzeros — the dense n x m list-of-lists is unusable for large m.
+
+        Args:
+            sparse (bool, optional): return a scipy.sparse.csc_matrix
+                instead of the dense list-of-lists. Defaults to False.
+
         Returns:
             List[List[int]]: incidence matrix of size n x m
+            (or scipy.sparse.csc_matrix of shape (n, m) when sparse=True).
         """
         n = self.vertices
-        edges = []
+        indptr, indices, _ = self.get_csr()
+        src = np.repeat(np.arange(n, dtype=np.int32), np.diff(indptr))
         if self.directed:
-            for u in range(n):
-                for v, i in sorted(self._adjacency_list[u], key=lambda x: (u, x[0])): # neighbour order for table
-                    edges.append((u, v))
+            U, V = src, indices
         else:
-            seen = set()
-            for u in range(n):
-                for v, i in self._adjacency_list[u]:
-                    if u < v and (u, v) not in seen and (v, u) not in seen:
-                        edges.append((u, v))
-                        seen.add((u, v))
-            edges.sort(key=lambda e: (min(e), max(e))) # we treat undirected edges and sort (u, v) and (v, u) like the same
-
-
-        m = len(edges)
-        matrix = [[0 for i in range(m)] for i in range(n)]
-        for idx, (u, v) in enumerate(edges):
-            if self.directed:
-                matrix[u][idx] = -1
-                matrix[v][idx] = 1
-            else:
-                matrix[u][idx] = 1
-                matrix[v][idx] = 1
-        return matrix
\ No newline at end of file
+            # each undirected edge appears as (u, v) and (v, u); keep the
+            # canonical u < v orientation, already in (min, max) order
+            keep = src < indices
+            U, V = src[keep], indices[keep]
+        m = int(U.shape[0])
+        cols = np.arange(m, dtype=np.int32)
+
+        if sparse:
+            from scipy.sparse import csc_matrix  # optional dependency
+            rows = np.concatenate([U, V])
+            col2 = np.concatenate([cols, cols])
+            data = np.concatenate([
+                np.full(m, -1 if self.directed else 1, dtype=np.int8),
+                np.ones(m, dtype=np.int8),
+            ])
+            return csc_matrix((data, (rows, col2)), shape=(n, m))
+
+        matrix = np.zeros((n, m), dtype=np.int64)
+        matrix[U, cols] = -1 if self.directed else 1
+        matrix[V, cols] = 1
+        return matrix.tolist()
\ No newline at end of file
@@ -24,13 +24,23 @@ class UnweightedGraph(Graph):
         if u == v:
             raise ValueError("self-loops are not allowed")
 
-        # add unique edge u->v
-        if (v, 1.0) not in self._adjacency_list[u]:
+        self._csr_cache = None  # edge set changes, drop cached representations
+        self._adj_cache = None
+        self._bitset_cache = None
+
+        self._insert_edge(u, v, 1.0)
+
+    def _insert_edge(self, u: int, v: int, w: float) -> None:
+        """Append a pre-validated edge with a fixed weight of 1.0."""
+        # add unique edge u->v; the neighbor index makes the check O(1)
+        if v not in self._neighbor_index[u]:
+            self._neighbor_index[u][v] = len(self._adjacency_list[u])
             self._adjacency_list[u].append((v, 1.0))
 
         # if the graph is undirected — add symmetric edge v->u
         if not self.directed:
-            if (u, 1.0) not in self._adjacency_list[v]:
+            if u not in self._neighbor_index[v]:
+                self._neighbor_index[v][u] = len(self._adjacency_list[v])
                 self._adjacency_list[v].append((u, 1.0))
 
 
@@ -57,15 +67,23 @@ class WeightedGraph(Graph):
             raise ValueError("self-loops are not allowed")
 
         w = float(weight)
+        self._csr_cache = None  # edge set changes, drop cached representations
+        self._adj_cache = None
+        self._bitset_cache = None
+
+        self._insert_edge(u, v, w)
 
-        # deterministically "update if exists, otherwise add"
+    def _insert_edge(self, u: int, v: int, w: float) -> None:
+        """Append or update a pre-validated edge with the given weight."""
+        # deterministically "update if exists, otherwise add";
+        # the neighbor index gives the position to overwrite in O(1)
         def _set_edge(src: int, dst: int, w: float):
             lst = self._adjacency_list[src]
-            for i, (nbr, _) in enumerate(lst):
-                if nbr == dst:
-                    lst[i] = (dst, w)
-                    break
+            idx = self._neighbor_index[src].get(dst)
+            if idx is not None:
+                lst[idx] = (dst, w)
             else:
+                self._neighbor_index[src][dst] = len(lst)
                 lst.append((dst, w))
 
         _set_edge(u, v, w)
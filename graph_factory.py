@@ -1,10 +1,29 @@
 from typing import List, Tuple, Union
+
+import numpy as np
+
 from graph_building import UnweightedGraph, WeightedGraph
 from graph_abc import Graph
 
 Number = Union[int, float]
 
 
+def _is_symmetric(A: np.ndarray, block: int = 256) -> bool:
+    """Check A == A.T in row blocks so a mismatch can bail out early.
+
+    A single np.any(A != A.T) always materializes and scans the full n x n
+    comparison; checking a block of rows at a time keeps the vectorized
+    C-speed compare but stops at the first asymmetric block, making the
+    failure case O(block * n) instead of O(n^2).
+    """
+    n = A.shape[0]
+    for i0 in range(0, n, block):
+        i1 = min(i0 + block, n)
+        if np.any(A[i0:i1, :] != A.T[i0:i1, :]):
+            return False
+    return True
+
+
 class GraphFactory:
     """
     Factory class for creating different types of graphs.
@@ -33,7 +52,8 @@ class GraphFactory:
         return WeightedGraph(vertices, directed)
 
     @staticmethod
-    def from_adjacency_matrix(matrix: List[List[Number]], directed: bool = False) -> Graph:
+    def from_adjacency_matrix(matrix: List[List[Number]], directed: bool = False,
+                              assume_symmetric: bool = False) -> Graph:
         """
         Create a graph from an adjacency matrix (provided by instructor or dataset).
 
@@ -41,49 +61,101 @@ class GraphFactory:
           - The matrix must be square (n x n)
           - The diagonal must contain only 0.0 (no self-loops)
           - For an undirected graph, the matrix must be symmetric
+            (skipped with assume_symmetric=True for callers that built the
+            matrix symmetric by construction — the check doubles the input
+            scan, which is pure overhead in that case)
 
         Weight determination:
           - If ALL non-zero elements == 1.0 -> unweighted
           - Otherwise -> weighted
+
+        The checks run as whole-matrix numpy operations (diagonal, symmetry,
+        non-zero masks) instead of nested Python loops with a float() call
+        per cell — on dense inputs this is orders of magnitude faster.
+
+        scipy.sparse matrices are accepted directly and handled in O(nnz)
+        via their COO triplets — no dense materialization.
         """
-        if not isinstance(matrix, list) or not matrix:
+        try:
+            from scipy.sparse import issparse  # optional dependency
+        except ImportError:
+            issparse = None
+        if issparse is not None and issparse(matrix):
+            return GraphFactory._from_sparse_matrix(matrix, directed, assume_symmetric)
+
+        if not isinstance(matrix, (list, np.ndarray)) or len(matrix) == 0:
             raise ValueError("matrix must be a non-empty list of lists")
-        n = len(matrix)
-        for row in matrix:
-            if len(row) != n:
-                raise ValueError("matrix must be square (n x n)")
-
-        nonzeros: List[float] = []
-        for i in range(n):
-            if float(matrix[i][i]) != 0.0:
-                raise ValueError("diagonal must be 0.0 (no self-loops)")
-            for j in range(n):
-                val = float(matrix[i][j])
-                if val != 0.0:
-                    nonzeros.append(val)
+        try:
+            A = np.asarray(matrix, dtype=np.float64)
+        except ValueError:
+            raise ValueError("matrix must be square (n x n)")
+        if A.ndim != 2 or A.shape[0] != A.shape[1]:
+            raise ValueError("matrix must be square (n x n)")
+        n = A.shape[0]
+
+        if np.any(np.diagonal(A) != 0.0):
+            raise ValueError("diagonal must be 0.0 (no self-loops)")
 
+        if not directed and not assume_symmetric and not _is_symmetric(A):
+            raise ValueError("undirected graph requires a symmetric matrix")
+
+        rows, cols = np.nonzero(A != 0.0)
         if not directed:
-            for i in range(n):
-                for j in range(n):
-                    if float(matrix[i][j]) != float(matrix[j][i]):
-                        raise ValueError("undirected graph requires a symmetric matrix")
+            # add each undirected edge only once: filter the O(nnz) index
+            # arrays down to the canonical upper-triangle orientation
+            # instead of np.triu(mask), which would allocate a second full
+            # n x n bool array just to zero the lower half — one n x n
+            # temporary (the non-zero mask) and O(nnz) everything after
+            keep = rows < cols
+            rows, cols = rows[keep], cols[keep]
+        data = A[rows, cols]
+
+        # classify over the extracted non-zero values (O(nnz)) rather than
+        # another full n x n temporary; for undirected inputs the upper
+        # triangle suffices since the matrix is symmetric
+        weighted = bool(np.any(data != 1.0))
+        g: Graph = WeightedGraph(n, directed) if weighted else UnweightedGraph(n, directed)
+
+        # one batch insert: validation and cache invalidation happen once
+        # for the whole column set instead of once per edge
+        g.add_edges(rows, cols, data)
+
+        return g
 
-        weighted = any(val != 1.0 for val in nonzeros)
+    @staticmethod
+    def _from_sparse_matrix(matrix, directed: bool, assume_symmetric: bool = False) -> Graph:
+        """Build a graph from a scipy.sparse adjacency in O(nnz).
+
+        Same validations and weight rules as from_adjacency_matrix, but
+        performed on the COO triplets (row, col, data) — the matrix is
+        never densified.
+        """
+        coo = matrix.tocoo()
+        if coo.shape[0] != coo.shape[1]:
+            raise ValueError("matrix must be square (n x n)")
+        n = coo.shape[0]
+
+        # drop explicit zeros so stored-but-zero entries don't count as edges
+        keep = coo.data != 0
+        rows, cols, data = coo.row[keep], coo.col[keep], coo.data[keep]
+
+        if np.any(rows == cols):
+            raise ValueError("diagonal must be 0.0 (no self-loops)")
+
+        if not directed and not assume_symmetric and (matrix != matrix.T).nnz != 0:
+            raise ValueError("undirected graph requires a symmetric matrix")
+
+        weighted = bool(np.any(data != 1.0))
         g: Graph = WeightedGraph(n, directed) if weighted else UnweightedGraph(n, directed)
 
-        if directed:
-            for i in range(n):
-                for j in range(n):
-                    w = float(matrix[i][j])
-                    if i != j and w != 0.0:
-                        g.add_edge(i, j, w)
-        else:
-            # add each undirected edge only once
-            for i in range(n):
-                for j in range(i + 1, n):
-                    w = float(matrix[i][j])
-                    if w != 0.0:
-                        g.add_edge(i, j, w)
+        if not directed:
+            # symmetric input: keep the canonical upper-triangle orientation
+            upper = rows < cols
+            rows, cols, data = rows[upper], cols[upper], data[upper]
+
+        # one batch insert: validation and cache invalidation happen once
+        # for the whole column set instead of once per edge
+        g.add_edges(rows, cols, data)
 
         return g
 
@@ -126,14 +198,33 @@ class GraphFactory:
         if edges is None:
             raise ValueError("edges must be a list of (u, v, w)")
 
-        weighted = any(float(w) != 1.0 for _, _, w in edges) if edges else False
+        # split the edge list into flat columns once; range checks,
+        # self-loop check, weight coercion to float64 and the weightedness
+        # classification then run as single C-speed passes instead of
+        # per-edge Python comparisons and float() calls
+        if edges:
+            us = np.fromiter((e[0] for e in edges), np.int64, count=len(edges))
+            vs = np.fromiter((e[1] for e in edges), np.int64, count=len(edges))
+            ws = np.fromiter((e[2] for e in edges), np.float64, count=len(edges))
+
+            out = (us < 0) | (us >= vertices) | (vs < 0) | (vs >= vertices)
+            if np.any(out):
+                bad = int(np.argmax(out))
+                raise IndexError(
+                    f"edge ({edges[bad][0]}, {edges[bad][1]}) is out of vertex range [0, {vertices-1}]"
+                )
+            if np.any(us == vs):
+                raise ValueError("self-loops are not allowed")
+            weighted = bool(np.any(ws != 1.0))
+        else:
+            weighted = False
+
         g: Graph = WeightedGraph(vertices, directed) if weighted else UnweightedGraph(vertices, directed)
 
-        for (u, v, w) in edges:
-            if not (0 <= u < vertices) or not (0 <= v < vertices):
-                raise IndexError(f"edge ({u}, {v}) is out of vertex range [0, {vertices-1}]")
-            if u == v:
-                raise ValueError("self-loops are not allowed")
-            g.add_edge(u, v, float(w))
+        # replay the edges from the columns built above — the original list
+        # of tuples is traversed exactly once (by np.fromiter), not a second
+        # time for the emission
+        if edges:
+            g.add_edges(us, vs, ws)
 
         return g
@@ -1,19 +1,83 @@
-def longest_prefix_suffix(s: str) -> str:
+from array import array
+
+import numpy as np
+
+try:
+    from numba import njit
+    _HAVE_NUMBA = True
+except ImportError:  # pure-Python loop below still works, just slower
+    _HAVE_NUMBA = False
+
+
+def _lps(codes):
+    # KMP failure function over a flat uint32 codepoint buffer — tight
+    # integer compares, no Python objects in the loop
+    n = len(codes)
+    lps = np.zeros(n, dtype=np.int32)
+    j = 0
+    for i in range(1, n):
+        while j > 0 and codes[i] != codes[j]:
+            j = lps[j - 1]
+        if codes[i] == codes[j]:
+            j += 1
+            lps[i] = j
+    return lps
+
+
+if _HAVE_NUMBA:
+    _lps = njit("i4[::1](u4[::1])", cache=True)(_lps)
+
+
+def prefix_suffix_length(s: str) -> int:
+    """Length of the longest proper prefix of s that is also its suffix.
+
+    Integer-only variant for callers that just need the overlap length
+    (e.g. KMP-style preprocessing over many strings) — no result slice
+    is allocated.
+    """
+    # "" would make lps[-1] blow up with IndexError, and a single
+    # character cannot have a non-empty proper prefix-suffix — answer
+    # both in O(1) without touching the failure function
+    if len(s) < 2:
+        return 0
+
+    if _HAVE_NUMBA:
+        # utf-32-le gives one uint32 per character, so byte offsets and
+        # character offsets coincide even for non-ASCII input (bytearray
+        # keeps the buffer writable, which the kernel signature expects)
+        codes = np.frombuffer(bytearray(s.encode("utf-32-le")), dtype=np.uint32)
+        lps = _lps(codes)
+        return int(lps[-1])
+
     n = len(s)
-    lps = [0] * n # longest prefix string, which is prefix-suffix; fine to use array bc strings are char arrays anyways
+    # indexing a str allocates a one-character str per comparison; a
+    # memoryview over the utf-32 buffer yields cached small ints instead,
+    # so the compares below run at C level even without the JIT
+    codes = memoryview(s.encode("utf-32-le")).cast("I")
+    # array('i') packs the table into contiguous 4-byte ints (~28 bytes per
+    # entry as a list of boxed ints), which keeps the random lps[j - 1]
+    # reads of the while-loop inside the cache for long strings
+    lps = array("i", bytes(4 * n)) # longest prefix string, which is prefix-suffix
     j = 0
     for i in range(1, n):
-        while j > 0 and s[i] != s[j]:
+        while j > 0 and codes[i] != codes[j]:
             j = lps[j - 1]
-        if s[i] == s[j]:
+        if codes[i] == codes[j]:
             j += 1
             lps[i] = j
-    return s[:lps[-1]] if s[:lps[-1]] else "there is no prefix"
+    return lps[-1]
+
+
+def longest_prefix_suffix(s: str) -> str:
+    # branch on the overlap length, not on a second throwaway slice
+    k = prefix_suffix_length(s)
+    return s[:k] if k else "there is no prefix"
 
 # We build our overlap incrementally and reuse the result, so asymptotics is O(n)
+# (and the failure-function loop runs as native code when numba is around)
 
 print(longest_prefix_suffix("ababcab"))  # ab
 print(longest_prefix_suffix("aaaa"))     # aaa
 print(longest_prefix_suffix("gattaca"))     # ""
 print(longest_prefix_suffix("ACAB"))     # "", # Fuck Tha Police. N.W.A starts playing in the background
-print(longest_prefix_suffix("abcababcab")) # abcab
\ No newline at end of file
+print(longest_prefix_suffix("abcababcab")) # abcab